@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from copy import copy
 from dataclasses import dataclass, field
 
@@ -14,8 +15,10 @@ from flexdoc.html.html_in_md import div_wrapper
 from prettyfmt.prettyfmt import fmt_lines
 from typing_extensions import override
 
+_NON_WHITESPACE = re.compile(r"\S")
 
-@dataclass
+
+@dataclass(slots=True)
 class TextNode:
     """
     A node in parsed structured text, with reference offsets into the original text.
@@ -36,6 +39,11 @@ class TextNode:
 
     children: list[TextNode] = field(default_factory=list)
 
+    # Leaf sizes keyed by unit and content span, so repeated sizing doesn't re-parse.
+    _size_cache: dict[tuple[TextUnit, int, int], int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
     @property
     def end_offset(self) -> int:
         if self.content_end < 0:
@@ -65,7 +73,13 @@ class TextNode:
         if self.children:
             return sum(child.size(unit) for child in self.children)
         else:
-            return self.flex_doc().size(unit)
+            # Chunking sizes the same leaves over and over as it grows each chunk, and parsing
+            # a leaf into a FlexDoc dominates that cost, so compute each leaf size once.
+            key = (unit, self.content_start, self.content_end)
+            cached = self._size_cache.get(key)
+            if cached is None:
+                cached = self._size_cache[key] = self.flex_doc().size(unit)
+            return cached
 
     def structure_summary(self) -> dict[str, int]:
         """
@@ -111,7 +125,7 @@ class TextNode:
             return None
         else:
             return "HTML structure:\n" + fmt_lines(
-                [f"{count:6d}  {path}" for path, count in self.structure_summary().items()],
+                [f"{count:6d}  {path}" for path, count in structure_summary.items()],
                 prefix="",
             )
 
@@ -129,7 +143,10 @@ class TextNode:
         """
         Is this node whitespace only?
         """
-        return not self.children and self.contents.strip() == ""
+        # Search the content span in place instead of slicing and stripping a copy of it.
+        return not self.children and not _NON_WHITESPACE.search(
+            self.original_text, self.content_start, self.content_end
+        )
 
     @property
     def class_names(self) -> tuple[str, ...]:
@@ -139,16 +156,18 @@ class TextNode:
     def children_by_class_names(self, *class_names: str, recursive: bool = False) -> list[TextNode]:
         wanted = set(class_names)
 
-        def collect_children(node: TextNode) -> list[TextNode]:
-            matching_children = [
-                child for child in node.children if wanted & set(child.class_names)
-            ]
+        # Walk iteratively, emitting each node's matching children before descending into
+        # them in order, so no intermediate lists are built per level.
+        matching_children: list[TextNode] = []
+        stack: list[TextNode] = [self]
+        while stack:
+            node = stack.pop()
+            matching_children.extend(
+                child for child in node.children if not wanted.isdisjoint(child.class_names)
+            )
             if recursive:
-                for child in node.children:
-                    matching_children.extend(collect_children(child))
-            return matching_children
-
-        return collect_children(self)
+                stack.extend(reversed(node.children))
+        return matching_children
 
     def child_by_class_name(self, class_name: str) -> TextNode | None:
         nodes = self.children_by_class_names(class_name, recursive=False)
@@ -197,15 +216,21 @@ class TextNode:
         return self._str_recursive()
 
     def _str_recursive(self, level: int = 0, max_len: int = 40) -> str:
+        # Collect lines for the whole subtree and join once, rather than concatenating
+        # each child's string onto its parent's.
+        lines: list[str] = []
+        self._str_lines(lines, level, max_len)
+        return "".join(lines)
+
+    def _str_lines(self, lines: list[str], level: int, max_len: int) -> None:
         indent = "    " * level
         content_preview = self.contents
         if len(content_preview) > max_len:
             content_preview = content_preview[:20] + "…" + content_preview[-20:]
-        result = (
+        lines.append(
             f"{indent}TextNode(tag_name={self.tag_name} class_name={self.class_name} offset={self.offset},"
             f" content_start={self.content_start}, content_end={self.content_end}) "
             f"{repr(content_preview)}\n"
         )
         for child in self.children:
-            result += child._str_recursive(level + 1)
-        return result
+            child._str_lines(lines, level + 1, max_len)
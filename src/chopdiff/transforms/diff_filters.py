@@ -1,5 +1,7 @@
+import operator
 from collections import Counter
 from collections.abc import Callable, Collection
+from functools import partial
 from typing import TypeAlias
 
 from flexdoc.docs.token_diffs import DiffFilter, DiffOp, OpType
@@ -32,42 +34,71 @@ TokenMatcher: TypeAlias = Collection[str] | Callable[[str], bool]
 TokenPattern: TypeAlias = str | Callable[[str], bool] | WildcardToken
 
 
-def _matches_pattern(tokens: list[str], pattern: list[TokenPattern]) -> bool:
-    def match_from(i: int, j: int) -> bool:
-        while i <= len(tokens) and j < len(pattern):
-            pattern_elem = pattern[j]
-            if pattern_elem == WILDCARD_TOK:
-                # If '*' is the last pattern element, it matches any remaining tokens.
-                if j + 1 == len(pattern):
-                    return True
-                # Advance pattern index to next pattern after ANY_TOKEN.
-                j += 1
-                while i < len(tokens):
-                    if match_from(i, j):
-                        return True
-                    i += 1
+TokenTest: TypeAlias = Callable[[str], bool]
+
+
+def _never(_tok: str) -> bool:
+    return False
+
+
+def _compile_pattern(pattern: list[TokenPattern]) -> Callable[[list[str]], bool]:
+    """
+    Compile a token pattern into a matcher function. Each pattern element becomes a slot that
+    is either a wildcard or a test on one token (exact string match or predicate).
+
+    Matching tracks the set of slots reachable after each token rather than backtracking, so
+    it is linear in the number of tokens times the pattern length however many wildcards
+    the pattern has.
+    """
+    nslots = len(pattern)
+    is_wildcard: list[bool] = []
+    tests: list[TokenTest] = []
+    for elem in pattern:
+        is_wildcard.append(isinstance(elem, WildcardToken))
+        if isinstance(elem, str):
+            tests.append(partial(operator.eq, elem))
+        elif callable(elem):
+            tests.append(elem)
+        else:
+            tests.append(_never)
+
+    def add_state(slot: int, states: set[int]) -> None:
+        # A wildcard may match zero tokens, so reaching it also reaches the slots after it.
+        while slot < nslots and is_wildcard[slot]:
+            states.add(slot)
+            slot += 1
+        states.add(slot)
+
+    def matches(tokens: list[str]) -> bool:
+        states: set[int] = set()
+        add_state(0, states)
+        for token in tokens:
+            next_states: set[int] = set()
+            for slot in states:
+                if slot == nslots:
+                    continue
+                if is_wildcard[slot]:
+                    add_state(slot, next_states)
+                elif tests[slot](token):
+                    add_state(slot + 1, next_states)
+            if not next_states:
                 return False
-            else:
-                if i >= len(tokens):
-                    return False
-                token = tokens[i]
-                if isinstance(pattern_elem, str):
-                    if token != pattern_elem:
-                        return False
-                elif callable(pattern_elem):
-                    if not pattern_elem(token):
-                        return False
-                else:
-                    return False
-                i += 1
-                j += 1
-        # Skip any remaining ANY_TOKEN in the pattern.
-        while j < len(pattern) and pattern[j] == WILDCARD_TOK:
-            j += 1
-        # The tokens match the pattern if both indices are at the end.
-        return i == len(tokens) and j == len(pattern)
-
-    return match_from(0, 0)
+            states = next_states
+        return nslots in states
+
+    return matches
+
+
+def _compile_ignore(ignore: TokenMatcher | None) -> TokenTest | None:
+    """
+    Resolve an `ignore` matcher to a single token test, or None if nothing is ignored.
+    """
+    if not ignore:
+        return None
+    if callable(ignore):
+        return ignore
+    ignored_tokens = frozenset({ignore} if isinstance(ignore, str) else ignore)
+    return ignored_tokens.__contains__
 
 
 def make_token_sequence_filter(
@@ -84,20 +115,19 @@ def make_token_sequence_filter(
     `ignore` may be a collection of exact tokens or a predicate for tokens to remove
     before matching.
     """
+    # Compile the pattern and ignore matcher once, not on every call.
+    matches = _compile_pattern(pattern)
+    is_ignored = _compile_ignore(ignore)
 
     def filter_fn(diff_op: DiffOp) -> bool:
         if action and diff_op.action != action:
             return False
 
         tokens = diff_op.all_changed()
-        if ignore:
-            if callable(ignore):
-                tokens = [tok for tok in tokens if not ignore(tok)]
-            else:
-                ignored_tokens = {ignore} if isinstance(ignore, str) else ignore
-                tokens = [tok for tok in tokens if tok not in ignored_tokens]
+        if is_ignored:
+            tokens = [tok for tok in tokens if not is_ignored(tok)]
 
-        return _matches_pattern(tokens, pattern)
+        return matches(tokens)
 
     return filter_fn
 
@@ -125,12 +155,16 @@ def no_word_lemma_changes(diff_op: DiffOp) -> bool:
     if diff_op.action == OpType.EQUAL:
         return True
     elif diff_op.action == OpType.REPLACE:
-        return lemmatized_equal(
-            " ".join(tok for tok in diff_op.left if is_word(tok)),
-            " ".join(tok for tok in diff_op.right if is_word(tok)),
-        )
+        left_words = [tok for tok in diff_op.left if is_word(tok)]
+        right_words = [tok for tok in diff_op.right if is_word(tok)]
+        # Skip the lemmatizer when the answer doesn't depend on it.
+        if left_words == right_words:
+            return True
+        if not left_words or not right_words:
+            return False
+        return lemmatized_equal(" ".join(left_words), " ".join(right_words))
     else:
-        return len([tok for tok in diff_op.all_changed() if is_word(tok)]) == 0
+        return not any(is_word(tok) for tok in diff_op.all_changed())
 
 
 def removes_words(diff_op: DiffOp) -> bool:
@@ -165,16 +199,27 @@ def removes_word_lemmas(diff_op: DiffOp) -> bool:
         return False
 
 
+_HEADER_TAGS = ["h1", "h2", "h3", "h4", "h5", "h6"]
+
+
+def _is_header_open(tok: str) -> bool:
+    return is_tag_open(tok, tag_names=_HEADER_TAGS)
+
+
+def _is_header_close(tok: str) -> bool:
+    return is_tag_close(tok, tag_names=_HEADER_TAGS)
+
+
+# Built once at import rather than on every call.
+_adds_headings_matcher = make_token_sequence_filter(
+    [_is_header_open, WILDCARD_TOK, _is_header_close],
+    action=OpType.INSERT,
+    ignore=is_break_or_space,
+)
+
+
 def adds_headings(diff_op: DiffOp) -> bool:
     """
     Only accept changes that add contents within header tags.
     """
-    headers = ["h1", "h2", "h3", "h4", "h5", "h6"]
-    is_header = lambda tok: is_tag_open(tok, tag_names=headers)  # pyright: ignore
-    is_header_close = lambda tok: is_tag_close(tok, tag_names=headers)  # pyright: ignore
-    matcher = make_token_sequence_filter(
-        [is_header, WILDCARD_TOK, is_header_close],
-        action=OpType.INSERT,
-        ignore=is_break_or_space,
-    )
-    return matcher(diff_op)
+    return _adds_headings_matcher(diff_op)
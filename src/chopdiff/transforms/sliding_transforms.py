@@ -4,15 +4,25 @@ transformed text.
 """
 
 import logging
-from collections.abc import Callable
+import pickle
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass
 from math import ceil
 from typing import Any, TypeAlias
 
 from flexdoc import FlexDoc
-from flexdoc.docs import Paragraph
+from flexdoc.docs import Paragraph, SentIndex
 from flexdoc.docs.sizes import TextUnit
-from flexdoc.docs.token_diffs import DIFF_FILTER_NONE, DiffFilter, diff_docs, find_best_alignment
-from flexdoc.docs.wordtoks import join_wordtoks
+from flexdoc.docs.token_diffs import (
+    DIFF_FILTER_NONE,
+    DiffFilter,
+    TokenDiff,
+    diff_wordtoks,
+    find_best_alignment,
+)
+from flexdoc.docs.wordtoks import PARA_BR_TOK, SENT_BR_TOK, join_wordtoks
 from flowmark import fill_markdown
 from prettyfmt.prettyfmt import fmt_lines
 
@@ -25,8 +35,16 @@ FlexDocTransform: TypeAlias = Callable[[FlexDoc], FlexDoc]
 
 SaveFunc: TypeAlias = Callable[[str, str, Any], None]
 
+_WindowMapper: TypeAlias = Callable[
+    [Iterable[FlexDoc], FlexDocTransform], Iterable[tuple[FlexDoc, FlexDoc]]
+]
+"""
+Passes each window through a transform, yielding `(window, transformed_window)` pairs in window
+order.
+"""
+
 
-def remove_window_br(doc: FlexDoc):
+def remove_window_br(doc: FlexDoc) -> None:
     """
     Remove `<!--window-br-->` markers in a document.
     """
@@ -48,22 +66,90 @@ def filtered_transform(
 
     `debug_save` is an optional function that takes a message, a filename, and an object, and saves
     the object to a file for debugging.
+
+    If `windowing.parallel_filter` is set, each window's diff filtering runs in a process pool
+    while later windows are transformed, so `diff_filter` must be picklable.
     """
+    # Resolve the accept-all filter once so the per-window path never re-checks it.
+    if diff_filter is DIFF_FILTER_NONE:
+        diff_filter = None
+
     if not windowing or not windowing.size:
         # Whole-document transform still enforces the diff filter (the filter contract
         # holds with or without windowing).
         transformed_doc = transform_func(doc)
         return _enforce_diff_filter(doc, transformed_doc, diff_filter, debug_save)
 
-    def transform_and_check_diff(input_doc: FlexDoc) -> FlexDoc:
+    def transform_unfiltered(input_doc: FlexDoc) -> FlexDoc:
         # Avoid having window breaks build up after multiple transforms.
         remove_window_br(input_doc)
-        transformed_doc = transform_func(input_doc)
+        return transform_func(input_doc)
+
+    if diff_filter is None and not debug_save:
+        # Common case: nothing to enforce or save, so skip diffing each window.
+        return sliding_window_transform(doc, transform_unfiltered, windowing)
+
+    if diff_filter is not None and windowing.parallel_filter:
+        # Fail before any window is transformed, not when the first filter job runs.
+        try:
+            pickle.dumps(diff_filter)
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            raise ValueError(
+                f"parallel_filter requires a picklable diff_filter, got {diff_filter!r}: {e}"
+            ) from e
+        with ProcessPoolExecutor() as pool:
+            return _sliding_window_transform(
+                doc,
+                transform_unfiltered,
+                windowing,
+                _parallel_filter_mapper(pool, diff_filter, debug_save),
+            )
+
+    def transform_and_check_diff(input_doc: FlexDoc) -> FlexDoc:
+        transformed_doc = transform_unfiltered(input_doc)
         return _enforce_diff_filter(input_doc, transformed_doc, diff_filter, debug_save)
 
     return sliding_window_transform(doc, transform_and_check_diff, windowing)
 
 
+@dataclass(frozen=True)
+class _FilteredDiff:
+    """
+    A transform's diff split into accepted and rejected changes, plus the input wordtoks with
+    only the accepted changes applied.
+    """
+
+    diff: TokenDiff
+    accepted_diff: TokenDiff
+    rejected_diff: TokenDiff
+    final_wordtoks: list[str]
+
+
+def _filter_wordtoks(
+    input_wordtoks: list[str],
+    transformed_wordtoks: list[str],
+    diff_filter: DiffFilter,
+) -> _FilteredDiff:
+    """
+    Diff the transformed wordtoks against the input and apply only the changes accepted by
+    `diff_filter`. Works on plain lists so it can run in a worker process.
+    """
+    diff = diff_wordtoks(input_wordtoks, transformed_wordtoks)
+    accepted_diff, rejected_diff = diff.filter(diff_filter)
+
+    input_size = len(input_wordtoks)
+    if not (
+        diff.left_size() == accepted_diff.left_size() == rejected_diff.left_size() == input_size
+    ):
+        raise ValueError(
+            f"Diff left-size mismatch enforcing filter: diff={diff.left_size()}, "
+            f"accepted={accepted_diff.left_size()}, rejected={rejected_diff.left_size()}, "
+            f"input={input_size}"
+        )
+
+    return _FilteredDiff(diff, accepted_diff, rejected_diff, accepted_diff.apply_to(input_wordtoks))
+
+
 def _enforce_diff_filter(
     input_doc: FlexDoc,
     transformed_doc: FlexDoc,
@@ -73,45 +159,47 @@ def _enforce_diff_filter(
     """
     Apply `diff_filter` to the change between `input_doc` and `transformed_doc`, returning a
     document with only the accepted changes. Used by both the whole-document and windowed
-    paths so the filter contract is identical. With no filter, returns `transformed_doc`.
+    paths so the filter contract is identical. With no filter, returns `transformed_doc`;
+    `filtered_transform` has already resolved `DIFF_FILTER_NONE` to None.
     """
-    has_filter = diff_filter and diff_filter != DIFF_FILTER_NONE
-
-    diff = None
-    accepted_diff = None
-    rejected_diff = None
-    if has_filter:
-        diff = diff_docs(input_doc, transformed_doc)
-        accepted_diff, rejected_diff = diff.filter(diff_filter)
-
-        input_size = input_doc.size(TextUnit.wordtoks)
-        if not (
-            diff.left_size() == accepted_diff.left_size() == rejected_diff.left_size() == input_size
-        ):
-            raise ValueError(
-                f"Diff left-size mismatch enforcing filter: diff={diff.left_size()}, "
-                f"accepted={accepted_diff.left_size()}, rejected={rejected_diff.left_size()}, "
-                f"input={input_size}"
-            )
+    filtered = None
+    if diff_filter is not None:
+        filtered = _filter_wordtoks(
+            list(input_doc.as_wordtoks()), list(transformed_doc.as_wordtoks()), diff_filter
+        )
+
+    return _finish_diff_filter(input_doc, transformed_doc, filtered, debug_save)
 
+
+def _finish_diff_filter(
+    input_doc: FlexDoc,
+    transformed_doc: FlexDoc,
+    filtered: _FilteredDiff | None,
+    debug_save: SaveFunc | None = None,
+) -> FlexDoc:
+    """
+    Log and debug-save the result of filtering a transform, returning the final doc
+    (`transformed_doc` itself if there was no filter).
+    """
+    if filtered:
         log.info(
             "Accepted transform changes:\n%s",
-            fmt_lines(str(accepted_diff).splitlines()),
+            fmt_lines(str(filtered.accepted_diff).splitlines()),
         )
-        if rejected_diff.changes():
+        if filtered.rejected_diff.changes():
             log.info(
                 "Filtering extraneous changes:\n%s",
-                fmt_lines(rejected_diff.as_diff_str(False).splitlines()),
+                fmt_lines(filtered.rejected_diff.as_diff_str(False).splitlines()),
             )
 
-        # Apply only the accepted changes.
-        final_doc = FlexDoc.from_wordtoks(accepted_diff.apply_to(list(input_doc.as_wordtoks())))
+        # Only the accepted changes were applied.
+        final_doc = FlexDoc.from_wordtoks(filtered.final_wordtoks)
         log.info(
             "Word token changes:\n%s",
             fmt_lines(
                 [
-                    f"Accepted: {accepted_diff.stats()}",
-                    f"Rejected: {rejected_diff.stats()}",
+                    f"Accepted: {filtered.accepted_diff.stats()}",
+                    f"Rejected: {filtered.rejected_diff.stats()}",
                 ]
             ),
         )
@@ -119,31 +207,96 @@ def _enforce_diff_filter(
         final_doc = transformed_doc
 
     if debug_save:
+        # Reassemble each doc at most once; without a filter the final doc is the output doc.
+        output_text = transformed_doc.reassemble()
+        final_text = final_doc.reassemble() if final_doc is not transformed_doc else output_text
+
         debug_save(
             "Input doc normalized",
             "filtered_transform",
             fill_markdown(input_doc.reassemble()),
         )
-        debug_save("Output doc raw", "filtered_transform", transformed_doc.reassemble())
-        if diff:
-            debug_save("Transform diff", "filtered_transform", diff)
-        if rejected_diff:
-            debug_save("Rejected diff", "filtered_transform", rejected_diff)
-        debug_save("Final doc", "filtered_transform", final_doc.reassemble())
+        debug_save("Output doc raw", "filtered_transform", output_text)
+        if filtered:
+            debug_save("Transform diff", "filtered_transform", filtered.diff)
+            debug_save("Rejected diff", "filtered_transform", filtered.rejected_diff)
+        debug_save("Final doc", "filtered_transform", final_text)
 
     return final_doc
 
 
+def _map_windows(
+    windows: Iterable[FlexDoc], transform_func: FlexDocTransform
+) -> Iterator[tuple[FlexDoc, FlexDoc]]:
+    """
+    Default `_WindowMapper`: transform each window lazily, in order.
+    """
+    for window in windows:
+        yield window, transform_func(window)
+
+
+def _parallel_filter_mapper(
+    pool: Executor, diff_filter: DiffFilter, debug_save: SaveFunc | None
+) -> _WindowMapper:
+    """
+    A `_WindowMapper` that transforms windows in order but runs each window's diff filtering in
+    `pool` as soon as it is transformed, so CPU-bound filtering overlaps with transforming
+    later windows. Results are yielded in window order as soon as they are ready.
+    """
+
+    def map_windows(
+        windows: Iterable[FlexDoc], transform_func: FlexDocTransform
+    ) -> Iterator[tuple[FlexDoc, FlexDoc]]:
+        pending: deque[tuple[FlexDoc, FlexDoc, Future[_FilteredDiff]]] = deque()
+
+        def finish_front() -> tuple[FlexDoc, FlexDoc]:
+            window, transformed, future = pending.popleft()
+            return window, _finish_diff_filter(window, transformed, future.result(), debug_save)
+
+        for window in windows:
+            transformed = transform_func(window)
+            future = pool.submit(
+                _filter_wordtoks,
+                list(window.as_wordtoks()),
+                list(transformed.as_wordtoks()),
+                diff_filter,
+            )
+            pending.append((window, transformed, future))
+
+            # Hand back finished windows early so they aren't all held until the end.
+            while pending and pending[0][2].done():
+                yield finish_front()
+
+        while pending:
+            yield finish_front()
+
+    return map_windows
+
+
 def sliding_window_transform(
     doc: FlexDoc,
     transform_func: FlexDocTransform,
     settings: WindowSettings,
     on_alignment_failure: str = "raise",
+) -> FlexDoc:
+    return _sliding_window_transform(
+        doc, transform_func, settings, _map_windows, on_alignment_failure
+    )
+
+
+def _sliding_window_transform(
+    doc: FlexDoc,
+    transform_func: FlexDocTransform,
+    settings: WindowSettings,
+    map_windows: _WindowMapper,
+    on_alignment_failure: str = "raise",
 ) -> FlexDoc:
     if settings.unit == TextUnit.wordtoks:
-        return sliding_wordtok_window_transform(doc, transform_func, settings, on_alignment_failure)
+        return _sliding_wordtok_window_transform(
+            doc, transform_func, settings, map_windows, on_alignment_failure
+        )
     elif settings.unit == TextUnit.paragraphs:
-        return sliding_para_window_transform(doc, transform_func, settings)
+        return _sliding_para_window_transform(doc, transform_func, settings, map_windows)
     else:
         raise ValueError(f"Unsupported sliding transform unit: {settings.unit}")
 
@@ -163,17 +316,58 @@ def sliding_wordtok_window_transform(
     `on_alignment_failure` controls what happens when a transformed window is too short to align
     (fewer wordtoks than `min_overlap`): `"raise"` (default) raises `ValueError`; `"skip"` logs a
     warning and drops the window.
+
+    When `settings.shift == settings.size` the document is cut into consecutive windows of whole
+    sentences that don't overlap, so no alignment search is done: each transformed window is
+    appended after the separator and the sentence or paragraph break that preceded it in the
+    original document. This requires `min_overlap` to be 0. A shift larger than the size would
+    skip text, so it is rejected.
     """
+    return _sliding_wordtok_window_transform(
+        doc, transform_func, settings, _map_windows, on_alignment_failure
+    )
+
+
+def _sliding_wordtok_window_transform(
+    doc: FlexDoc,
+    transform_func: FlexDocTransform,
+    settings: WindowSettings,
+    map_windows: _WindowMapper,
+    on_alignment_failure: str = "raise",
+) -> FlexDoc:
     if settings.unit != TextUnit.wordtoks:
         raise ValueError(f"This sliding window expects wordtoks, not {settings.unit}")
     if on_alignment_failure not in ("raise", "skip"):
         raise ValueError(f"Invalid on_alignment_failure: {on_alignment_failure!r}")
 
-    windows = sliding_word_window(doc, settings.size, settings.shift, TextUnit.wordtoks)
+    if settings.shift > settings.size:
+        raise ValueError(
+            f"Window shift {settings.shift} larger than size {settings.size} would skip text"
+        )
+    no_overlap = settings.shift == settings.size
+    if no_overlap and settings.min_overlap:
+        raise ValueError(
+            f"Non-overlapping windows (shift == size {settings.size}) "
+            f"require min_overlap 0, got {settings.min_overlap}"
+        )
 
     nwordtoks = doc.size(TextUnit.wordtoks)
     nbytes = doc.size(TextUnit.bytes)
-    nwindows = ceil(nwordtoks / settings.shift)
+
+    # Break token from the original document that precedes each window (unused for the first).
+    window_brs: list[str] = []
+    if no_overlap:
+        # Offset-based windows can repeat or skip a sentence at a window edge, so tile by
+        # sentences instead.
+        window_ranges = _tiled_sent_ranges(doc, settings.size)
+        windows = (doc.sub_doc(first, last) for first, last in window_ranges)
+        window_brs = [
+            PARA_BR_TOK if first.sent_index == 0 else SENT_BR_TOK for first, _ in window_ranges
+        ]
+        nwindows = len(window_ranges)
+    else:
+        windows = sliding_word_window(doc, settings.size, settings.shift, TextUnit.wordtoks)
+        nwindows = ceil(nwordtoks / settings.shift)
     sep_wordtoks = [settings.separator] if settings.separator else []
 
     log.info(
@@ -185,22 +379,31 @@ def sliding_wordtok_window_transform(
     )
 
     output_wordtoks: list[str] = []
-    for i, window in enumerate(windows):
-        log.info(
-            "Sliding word transform window %s/%s (%s wordtoks, %s bytes), at %s wordtoks so far",
-            i + 1,
-            nwindows,
-            window.size(TextUnit.wordtoks),
-            window.size(TextUnit.bytes),
-            len(output_wordtoks),
-        )
 
-        transformed_window = transform_func(window)
+    def logged_windows() -> Iterator[FlexDoc]:
+        # Log each window as it is handed to the transform, before the transform runs.
+        for i, window in enumerate(windows):
+            log.info(
+                "Sliding word transform window %s/%s (%s wordtoks, %s bytes), at %s wordtoks so far",
+                i + 1,
+                nwindows,
+                window.size(TextUnit.wordtoks),
+                window.size(TextUnit.bytes),
+                len(output_wordtoks),
+            )
+            yield window
 
+    for i, (_, transformed_window) in enumerate(map_windows(logged_windows(), transform_func)):
         new_wordtoks = list(transformed_window.as_wordtoks())
 
         if not output_wordtoks:
             output_wordtoks = new_wordtoks
+        elif no_overlap:
+            output_wordtoks.append(window_brs[i])
+            output_wordtoks.extend(sep_wordtoks)
+            output_wordtoks.extend(new_wordtoks)
+
+            log.info("Sliding word transform: Appended non-overlapping window %s", i)
         else:
             if len(output_wordtoks) < settings.min_overlap:
                 raise ValueError(
@@ -229,7 +432,10 @@ def sliding_wordtok_window_transform(
                 diff.stats(),
             )
 
-            output_wordtoks = output_wordtoks[:offset] + sep_wordtoks + new_wordtoks
+            # Stitch in place so each window costs O(window), not O(output so far).
+            del output_wordtoks[offset:]
+            output_wordtoks.extend(sep_wordtoks)
+            output_wordtoks.extend(new_wordtoks)
 
     log.info(
         "Sliding word transform: Done, output total %s wordtoks",
@@ -243,6 +449,34 @@ def sliding_wordtok_window_transform(
     return output_doc
 
 
+def _tiled_sent_ranges(doc: FlexDoc, window_size: int) -> list[tuple[SentIndex, SentIndex]]:
+    """
+    Split `doc` into consecutive `(first, last)` sentence ranges of at most `window_size`
+    wordtoks each (counting one wordtok for each break between sentences), covering every
+    sentence exactly once.
+    """
+    ranges: list[tuple[SentIndex, SentIndex]] = []
+    first: SentIndex | None = None
+    last: SentIndex | None = None
+    current_size = 0
+    for index, sent in doc.sent_iter():
+        sent_size = sent.size(TextUnit.wordtoks)
+        if sent_size > window_size:
+            raise ValueError(f"Window size {window_size} too small for sentence at {index}")
+        if first is not None and last is not None and current_size + 1 + sent_size > window_size:
+            ranges.append((first, last))
+            first = None
+        if first is None:
+            first = index
+            current_size = sent_size
+        else:
+            current_size += 1 + sent_size
+        last = index
+    if first is not None and last is not None:
+        ranges.append((first, last))
+    return ranges
+
+
 def sliding_para_window_transform(
     doc: FlexDoc,
     transform_func: FlexDocTransform,
@@ -253,6 +487,16 @@ def sliding_para_window_transform(
     Apply a transformation function to each FlexDoc, stepping through paragraphs `settings.size`
     at a time, then reassemble the transformed document.
     """
+    return _sliding_para_window_transform(doc, transform_func, settings, _map_windows, normalizer)
+
+
+def _sliding_para_window_transform(
+    doc: FlexDoc,
+    transform_func: FlexDocTransform,
+    settings: WindowSettings,
+    map_windows: _WindowMapper,
+    normalizer: Callable[[str], str] = fill_markdown,
+) -> FlexDoc:
     if settings.unit != TextUnit.paragraphs:
         raise ValueError(f"This sliding window expects paragraphs, not {settings.unit}")
     if settings.size != settings.shift:
@@ -269,16 +513,19 @@ def sliding_para_window_transform(
         doc.size_summary(),
     )
 
-    transformed_paras: list[Paragraph] = []
-    for i, window in enumerate(windows):
-        log.info(
-            "Sliding paragraph transform: Window %s/%s input is %s",
-            i,
-            nwindows,
-            window.size_summary(),
-        )
+    def logged_windows() -> Iterator[FlexDoc]:
+        # Log each window as it is handed to the transform, before the transform runs.
+        for i, window in enumerate(windows):
+            log.info(
+                "Sliding paragraph transform: Window %s/%s input is %s",
+                i,
+                nwindows,
+                window.size_summary(),
+            )
+            yield window
 
-        new_doc = transform_func(window)
+    transformed_paras: list[Paragraph] = []
+    for i, (_, new_doc) in enumerate(map_windows(logged_windows(), transform_func)):
         if i > 0:
             try:
                 new_doc.paragraphs[0].sentences[0].text = (
@@ -14,6 +14,10 @@ class WindowSettings:
     """
     Size of the sliding window, the shift, and the min overlap required when stitching windows
     together. All sizes in wordtoks.
+
+    If `parallel_filter` is set, `filtered_transform` runs each window's diff filtering in a
+    process pool, so the diff filter must be picklable (a module-level function, not a lambda or
+    a closure such as one from `make_token_sequence_filter`).
     """
 
     unit: TextUnit
@@ -21,6 +25,7 @@ class WindowSettings:
     shift: int
     min_overlap: int = 0
     separator: str = ""
+    parallel_filter: bool = False
 
     def __post_init__(self):
         if self.size < 0:
@@ -44,7 +49,10 @@ class WindowSettings:
 
     @override
     def __str__(self):
-        return f"windowing size={self.size}, shift={self.shift}, min_overlap={self.min_overlap} {self.unit.value}"
+        return (
+            f"windowing size={self.size}, shift={self.shift}, min_overlap={self.min_overlap}, "
+            f"parallel_filter={self.parallel_filter} {self.unit.value}"
+        )
 
 
 WINDOW_NONE = WindowSettings(unit=TextUnit.wordtoks, size=0, shift=0, min_overlap=0, separator="")
@@ -1,8 +1,12 @@
 from textwrap import dedent
 
+import pytest
+from flexdoc import FlexDoc
 from flexdoc.docs.sizes import TextUnit
 
 from chopdiff.divs.div_elements import chunk_text_as_divs
+from chopdiff.divs.parse_divs import parse_divs
+from chopdiff.divs.text_node import TextNode
 
 
 def test_chunk_text_as_divs_with_div_leading_input():
@@ -21,3 +25,38 @@ def test_chunk_text_as_divs_with_div_leading_input():
     assert out.count("Alpha alpha alpha.") == 1
     assert out.count("Beta beta beta.") == 1
     assert out.count("Gamma gamma gamma.") == 1
+
+
+def test_leaf_size_is_cached_per_unit_and_span(monkeypatch: pytest.MonkeyPatch):
+    node = parse_divs(
+        '<div class="item">One two three.</div>\n\n<div class="item">Four five.</div>'
+    )
+    parsed: list[str] = []
+    flex_doc = TextNode.flex_doc
+
+    def counting_flex_doc(self: TextNode) -> FlexDoc:
+        parsed.append(self.contents)
+        return flex_doc(self)
+
+    monkeypatch.setattr(TextNode, "flex_doc", counting_flex_doc)
+
+    # Each leaf is parsed once per unit, however often it is sized.
+    assert node.size(TextUnit.words) == 5
+    assert node.size(TextUnit.words) == 5
+    assert len(parsed) == 2
+
+    # A slice shares the same leaf nodes, so it reuses their sizes.
+    assert node.slice_children(0, 0).size(TextUnit.words) == 3
+    assert node.slice_children(0, 1).size(TextUnit.words) == 5
+    assert len(parsed) == 2
+
+    # A different unit is sized separately.
+    node.size(TextUnit.wordtoks)
+    node.size(TextUnit.wordtoks)
+    assert len(parsed) == 4
+
+
+def test_text_node_has_no_instance_dict():
+    node = parse_divs("Para one.\n\nPara two.")
+    assert not hasattr(node, "__dict__")
+    assert not hasattr(node.slice_children(0, 0), "__dict__")
@@ -1,4 +1,5 @@
 from chopdiff.divs.parse_divs import parse_divs
+from chopdiff.divs.text_node import TextNode
 
 
 def test_parsed_div_multi_class_matching():
@@ -18,3 +19,30 @@ def test_reassemble_without_padding_preserves_original_div_tags():
     )
 
     assert parse_divs(text, skip_whitespace=False).reassemble(padding="") == text
+
+
+def test_whitespace_children_are_skipped():
+    text = '<div class="a">one</div>\n\n \t\n<div class="b">\n\n</div>'
+    raw = parse_divs(text, skip_whitespace=False)
+    assert [child.is_whitespace() for child in raw.children] == [False, True, False]
+    assert raw.children[2].children[0].is_whitespace()
+
+    parsed = parse_divs(text)
+    assert [child.class_name for child in parsed.children] == ["a", "b"]
+    assert parsed.children[1].children == []
+
+
+def test_children_by_class_names_recursive_order():
+    text = (
+        '<div class="x" id="1"><div class="x" id="1a">a</div><div class="y">'
+        '<div class="x" id="1b">b</div></div></div>'
+        '<div class="x" id="2"><div class="x" id="2a">c</div></div>'
+    )
+    root = parse_divs(text)
+
+    def ids(nodes: list[TextNode]) -> list[str]:
+        return [(node.begin_marker or "").split('id="')[1].split('"')[0] for node in nodes]
+
+    assert ids(root.children_by_class_names("x")) == ["1", "2"]
+    # Each node's direct matches come first, then each child's matches in document order.
+    assert ids(root.children_by_class_names("x", recursive=True)) == ["1", "2", "1a", "1b", "2a"]
@@ -1,11 +1,14 @@
 from textwrap import dedent
 
+import pytest
 from flexdoc import FlexDoc
 from flexdoc.docs.token_diffs import DiffOp, OpType, diff_wordtoks
 from flexdoc.docs.wordtoks import PARA_BR_TOK, SENT_BR_TOK, is_break_or_space
 
 from chopdiff.transforms.diff_filters import (
     WILDCARD_TOK,
+    TokenPattern,
+    adds_headings,
     changes_whitespace,
     make_token_sequence_filter,
     no_word_lemma_changes,
@@ -107,39 +110,95 @@ def test_token_sequence_filter_with_predicate():
     assert ignore_tokens_filter_fn(insert_op_with_whitespace)
 
 
-def test_no_word_changes_lemmatized():
-    assert not no_word_lemma_changes(DiffOp(OpType.INSERT, [], ["the"]))
-    assert not no_word_lemma_changes(DiffOp(OpType.DELETE, ["the"], []))
-    assert not no_word_lemma_changes(
-        DiffOp(
-            OpType.REPLACE,
-            ["The", "dogs", "were", "running", "fast"],
-            ["The", "dog", "was", "running"],
-        )
-    )
-    assert no_word_lemma_changes(
-        DiffOp(
-            OpType.REPLACE,
-            ["The", "dogs", "were", "running"],
-            ["The", "dog", "was", "running"],
-        )
-    )
+def test_token_sequence_filter_wildcards():
+    def insert(*toks: str) -> DiffOp:
+        return DiffOp(OpType.INSERT, [], list(toks))
 
+    sandwich = make_token_sequence_filter([WILDCARD_TOK, "a", WILDCARD_TOK, "b", WILDCARD_TOK])
+    assert sandwich(insert("a", "b"))
+    assert sandwich(insert("x", "a", "y", "a", "y", "b", "z"))
+    assert not sandwich(insert("b", "a"))
+    assert not sandwich(insert("a"))
 
-def test_removes_words():
-    assert removes_words(DiffOp(OpType.DELETE, ["Hello", " "], []))
-    assert removes_words(DiffOp(OpType.REPLACE, ["Hello", " ", "world"], ["world"]))
-    assert not removes_words(DiffOp(OpType.REPLACE, ["cat"], ["cat", "cat"]))
-    assert not removes_word_lemmas(DiffOp(OpType.REPLACE, ["cat"], ["cat", "cats"]))
-    assert not removes_words(DiffOp(OpType.REPLACE, ["Hello", " ", "world"], ["World"]))
-    assert removes_word_lemmas(DiffOp(OpType.REPLACE, ["Hello", " ", "world"], ["World"]))
+    # Many wildcards on a long non-matching sequence stays fast (no backtracking blowup).
+    many_pattern: list[TokenPattern] = [WILDCARD_TOK, "a"] * 20
+    many = make_token_sequence_filter(many_pattern + ["b"])
+    assert not many(insert(*(["a"] * 200)))
+    assert many(insert(*(["a"] * 200 + ["b"])))
 
-    assert not removes_words(
-        DiffOp(OpType.REPLACE, ["Hello", "*", "world"], ["hello", "*", "world"])
-    )
-    assert removes_word_lemmas(
-        DiffOp(OpType.REPLACE, ["Hello", "*", "world"], ["hello", "*", "world"])
-    )
+    empty = make_token_sequence_filter([])
+    assert empty(insert())
+    assert not empty(insert("a"))
+
+    # Adjacent wildcards match zero tokens too.
+    only_wildcards = make_token_sequence_filter([WILDCARD_TOK, WILDCARD_TOK])
+    assert only_wildcards(insert())
+    assert only_wildcards(insert("a", "b"))
+    trailing = make_token_sequence_filter(["b", WILDCARD_TOK, "a", WILDCARD_TOK, WILDCARD_TOK])
+    assert trailing(insert("b", "a"))
 
-    assert removes_words(DiffOp(OpType.DELETE, ["Hello", "world"], []))
-    assert removes_word_lemmas(DiffOp(OpType.DELETE, ["Hello", "world"], []))
+
+def test_adds_headings():
+    assert adds_headings(
+        DiffOp(OpType.INSERT, [], [PARA_BR_TOK, "<h2>", "Title", "</h2>", PARA_BR_TOK])
+    )
+    assert not adds_headings(DiffOp(OpType.INSERT, [], ["<p>", "Title", "</p>"]))
+    assert not adds_headings(DiffOp(OpType.DELETE, ["<h2>", "Title", "</h2>"], []))
+
+
+@pytest.mark.parametrize(
+    ("op", "expected"),
+    [
+        (DiffOp(OpType.INSERT, [], ["the"]), False),
+        (DiffOp(OpType.DELETE, ["the"], []), False),
+        (DiffOp(OpType.INSERT, [], [" ", ","]), True),
+        (DiffOp(OpType.REPLACE, ["dogs", ","], ["dogs", "."]), True),
+        (DiffOp(OpType.REPLACE, ["dogs"], [" "]), False),
+        (
+            DiffOp(
+                OpType.REPLACE,
+                ["The", "dogs", "were", "running", "fast"],
+                ["The", "dog", "was", "running"],
+            ),
+            False,
+        ),
+        (
+            DiffOp(
+                OpType.REPLACE,
+                ["The", "dogs", "were", "running"],
+                ["The", "dog", "was", "running"],
+            ),
+            True,
+        ),
+    ],
+)
+def test_no_word_changes_lemmatized(op: DiffOp, expected: bool):
+    assert no_word_lemma_changes(op) == expected
+
+
+@pytest.mark.parametrize(
+    ("op", "expected"),
+    [
+        (DiffOp(OpType.DELETE, ["Hello", " "], []), True),
+        (DiffOp(OpType.REPLACE, ["Hello", " ", "world"], ["world"]), True),
+        (DiffOp(OpType.REPLACE, ["cat"], ["cat", "cat"]), False),
+        (DiffOp(OpType.REPLACE, ["Hello", " ", "world"], ["World"]), False),
+        (DiffOp(OpType.REPLACE, ["Hello", "*", "world"], ["hello", "*", "world"]), False),
+        (DiffOp(OpType.DELETE, ["Hello", "world"], []), True),
+    ],
+)
+def test_removes_words(op: DiffOp, expected: bool):
+    assert removes_words(op) == expected
+
+
+@pytest.mark.parametrize(
+    ("op", "expected"),
+    [
+        (DiffOp(OpType.REPLACE, ["cat"], ["cat", "cats"]), False),
+        (DiffOp(OpType.REPLACE, ["Hello", " ", "world"], ["World"]), True),
+        (DiffOp(OpType.REPLACE, ["Hello", "*", "world"], ["hello", "*", "world"]), True),
+        (DiffOp(OpType.DELETE, ["Hello", "world"], []), True),
+    ],
+)
+def test_removes_word_lemmas(op: DiffOp, expected: bool):
+    assert removes_word_lemmas(op) == expected
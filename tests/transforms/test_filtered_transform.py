@@ -1,8 +1,13 @@
+import logging
+
+import pytest
 from flexdoc import FlexDoc
-from flexdoc.docs.token_diffs import DiffOp
+from flexdoc.docs.sizes import TextUnit
+from flexdoc.docs.token_diffs import DIFF_FILTER_NONE, DiffOp
 
+from chopdiff.transforms.diff_filters import make_token_sequence_filter
 from chopdiff.transforms.sliding_transforms import filtered_transform
-from chopdiff.transforms.window_settings import WINDOW_NONE
+from chopdiff.transforms.window_settings import WINDOW_NONE, WindowSettings
 
 
 def _reject_all(op: DiffOp) -> bool:  # pyright: ignore[reportUnusedParameter]
@@ -21,6 +26,10 @@ def _identity(doc: FlexDoc) -> FlexDoc:
     return doc
 
 
+def _to_upper(doc: FlexDoc) -> FlexDoc:
+    return FlexDoc.from_text(doc.reassemble().upper())
+
+
 def test_filtered_transform_enforces_filter_without_windowing():
     # A reject-all filter must keep the original even when windowing is disabled.
     doc = FlexDoc.from_text("hello")
@@ -42,3 +51,88 @@ def test_filtered_transform_does_not_mutate_input():
     before = doc.reassemble()
     filtered_transform(doc, _identity, None, diff_filter=_accept_all)
     assert doc.reassemble() == before
+
+
+def test_filtered_transform_windowed_without_filter():
+    # No filter (or the accept-all filter) takes the unfiltered fast path per window.
+    doc = FlexDoc.from_text("alpha beta. gamma delta. epsilon zeta. eta theta.")
+    windowing = WindowSettings(TextUnit.wordtoks, size=10, shift=10)
+    expected = "ALPHA BETA. GAMMA DELTA. EPSILON ZETA. ETA THETA."
+
+    assert filtered_transform(doc, _to_upper, windowing).reassemble() == expected
+    out = filtered_transform(doc, _to_upper, windowing, diff_filter=DIFF_FILTER_NONE)
+    assert out.reassemble() == expected
+
+
+def test_filtered_transform_parallel_filter_matches_serial():
+    doc = FlexDoc.from_text("alpha beta. gamma delta. epsilon zeta. eta theta.")
+    serial = WindowSettings(TextUnit.wordtoks, size=10, shift=10)
+    parallel = WindowSettings(TextUnit.wordtoks, size=10, shift=10, parallel_filter=True)
+
+    # Filters must be picklable (module-level) to run in the process pool.
+    for diff_filter in (_reject_all, _accept_all):
+        out_serial = filtered_transform(doc, _to_upper, serial, diff_filter=diff_filter)
+        out_parallel = filtered_transform(doc, _to_upper, parallel, diff_filter=diff_filter)
+        assert out_parallel.reassemble() == out_serial.reassemble()
+
+    out = filtered_transform(doc, _to_upper, parallel, diff_filter=_reject_all)
+    assert out.reassemble() == doc.reassemble()
+
+
+def test_filtered_transform_parallel_filter_rejects_unpicklable_filter():
+    doc = FlexDoc.from_text("alpha beta. gamma delta. epsilon zeta. eta theta.")
+    parallel = WindowSettings(TextUnit.wordtoks, size=10, shift=10, parallel_filter=True)
+    calls: list[FlexDoc] = []
+
+    def transform(d: FlexDoc) -> FlexDoc:
+        calls.append(d)
+        return d
+
+    # Filters built by make_token_sequence_filter are closures, which can't be pickled.
+    unpicklable = make_token_sequence_filter(["alpha"])
+    with pytest.raises(ValueError, match="picklable"):
+        filtered_transform(doc, transform, parallel, diff_filter=unpicklable)
+    assert calls == []
+
+
+def test_filtered_transform_logs_window_before_transforming(caplog: pytest.LogCaptureFixture):
+    doc = FlexDoc.from_text("alpha beta. gamma delta. epsilon zeta. eta theta.")
+    windowing = WindowSettings(TextUnit.wordtoks, size=10, shift=10)
+
+    def transform(d: FlexDoc) -> FlexDoc:
+        logging.getLogger(__name__).info("transforming")
+        return d
+
+    with caplog.at_level(logging.INFO):
+        filtered_transform(doc, transform, windowing, diff_filter=_accept_all)
+
+    events = [
+        "window" if msg.startswith("Sliding word transform window") else msg
+        for msg in caplog.messages
+        if msg.startswith("Sliding word transform window") or msg == "transforming"
+    ]
+    assert events == ["window", "transforming", "window", "transforming"]
+
+
+def test_filtered_transform_debug_save():
+    saved: list[tuple[str, object]] = []
+
+    def debug_save(msg: str, _filename: str, obj: object) -> None:
+        saved.append((msg, obj))
+
+    doc = FlexDoc.from_text("hello")
+    out = filtered_transform(doc, _to_goodbye, None, debug_save=debug_save)
+    assert out.reassemble() == "goodbye"
+    assert dict(saved)["Output doc raw"] == "goodbye"
+    assert dict(saved)["Final doc"] == "goodbye"
+
+    saved.clear()
+    filtered_transform(doc, _to_goodbye, None, diff_filter=_reject_all, debug_save=debug_save)
+    assert [msg for msg, _ in saved] == [
+        "Input doc normalized",
+        "Output doc raw",
+        "Transform diff",
+        "Rejected diff",
+        "Final doc",
+    ]
+    assert dict(saved)["Final doc"] == "hello"
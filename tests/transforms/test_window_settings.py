@@ -33,3 +33,8 @@ def test_window_none_is_valid_and_falsy():
 def test_valid_window_settings_construct():
     w = WindowSettings(TextUnit.wordtoks, size=2048, shift=1792, min_overlap=8)
     assert w.size == 2048
+
+
+def test_window_settings_str_shows_parallel_filter():
+    w = WindowSettings(TextUnit.wordtoks, size=10, shift=10, parallel_filter=True)
+    assert "parallel_filter=True" in str(w)
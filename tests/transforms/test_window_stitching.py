@@ -37,3 +37,52 @@ def test_wordtok_window_alignment_failure_skip_does_not_raise():
         doc, _shrink_after_first(), settings, on_alignment_failure="skip"
     )
     assert out is not None
+
+
+def test_wordtok_window_non_overlapping_concatenates():
+    doc = FlexDoc.from_text("alpha beta. gamma delta. epsilon zeta. eta theta.")
+    settings = WindowSettings(TextUnit.wordtoks, size=10, shift=10, separator="|")
+    out = sliding_wordtok_window_transform(doc, lambda d: d, settings)
+    assert out.reassemble() == "alpha beta. gamma delta. |epsilon zeta. eta theta."
+
+
+def test_wordtok_window_non_overlapping_keeps_paragraph_breaks():
+    text = "alpha beta. gamma delta.\n\nepsilon zeta. eta theta.\n\niota kappa. lambda mu."
+    settings = WindowSettings(TextUnit.wordtoks, size=10, shift=10)
+    out = sliding_wordtok_window_transform(FlexDoc.from_text(text), lambda d: d, settings)
+    assert out.reassemble() == text
+
+
+def test_wordtok_window_non_overlapping_covers_each_sentence_once():
+    # Offset-based windows would repeat "Alpha theta gamma beta." at the window edge here.
+    text = (
+        "Eta zeta.\n\nTheta. Alpha kappa alpha.\n\n"
+        "Alpha theta gamma beta.\n\nGamma beta gamma. Eta eta."
+    )
+    settings = WindowSettings(TextUnit.wordtoks, size=23, shift=23)
+    out = sliding_wordtok_window_transform(FlexDoc.from_text(text), lambda d: d, settings)
+    assert out.reassemble() == text
+
+
+def test_wordtok_window_rejects_shift_larger_than_size():
+    doc = FlexDoc.from_text("alpha beta. gamma delta.\n\nepsilon zeta. eta theta.")
+    settings = WindowSettings(TextUnit.wordtoks, size=10, shift=20)
+    raised: str | None = None
+    try:
+        sliding_wordtok_window_transform(doc, lambda d: d, settings)
+    except ValueError as e:
+        raised = str(e)
+    assert raised is not None
+    assert "skip text" in raised
+
+
+def test_wordtok_window_non_overlapping_rejects_min_overlap():
+    doc = FlexDoc.from_text("alpha beta. gamma delta. epsilon zeta. eta theta.")
+    settings = WindowSettings(TextUnit.wordtoks, size=10, shift=10, min_overlap=2)
+    raised: str | None = None
+    try:
+        sliding_wordtok_window_transform(doc, lambda d: d, settings)
+    except ValueError as e:
+        raised = str(e)
+    assert raised is not None
+    assert "min_overlap" in raised